@@ -1,113 +1,147 @@
 """The ``jouvence.console`` module contains utilities for rendering
 a Foutain screenplay in a terminal.
 """
+import io
 import os
 import colorama
-from .renderer import BaseDocumentRenderer, BaseTextRenderer
+from .renderer import BaseDocumentRenderer, BaseTextRenderer, \
+    _section_prefix
+
+
+_NL = os.linesep
+
+_RULE = '=' * 80
+
+# The ANSI style prefixes are assembled once at module load, so the
+# render path doesn't redo the attribute lookups and concatenations
+# for every paragraph.
+_DIM = colorama.Style.DIM
+_BRIGHT = colorama.Style.BRIGHT
+_NORMAL = colorama.Style.NORMAL
+_RESET_ALL = colorama.Style.RESET_ALL
+_STYLE_HEADING = colorama.Fore.WHITE + colorama.Style.BRIGHT
+_STYLE_CHARACTER = colorama.Fore.WHITE
+_STYLE_LYRICS = colorama.Fore.MAGENTA
+_STYLE_SECTION = colorama.Fore.CYAN
+_STYLE_SYNOPSIS = colorama.Fore.GREEN
+_STYLE_NOTE = colorama.Style.DIM + colorama.Fore.MAGENTA
 
 
 def _w(out, style, text, reset_all=False):
-    f = out.write
-    f(style)
-    f(text)
     if not reset_all:
-        f(colorama.Style.NORMAL)
+        reset = _NORMAL
     else:
-        f(colorama.Style.RESET_ALL)
-    f(os.linesep)
+        reset = _RESET_ALL
+    # Coalesce the styled line into a single write call.
+    out.write(style + text + reset + _NL)
 
 
 class ConsoleDocumentRenderer(BaseDocumentRenderer):
     """A document renderer that prints a screenplay into a terminal with
     some nice syntax highlighting.
     """
+    # The title page keys never change, so don't rebuild the lists on
+    # every call.
+    _CENTER_KEYS = ('title', 'credit', 'author', 'authors', 'source')
+    _BOTTOM_KEYS = ('date', 'draft date', 'contact', 'copyright')
+
     def __init__(self, width=80):
         super().__init__(ConsoleTextRenderer())
         self.width = width
-        colorama.init()
+        # Only Windows consoles need colorama's stdout wrapping, which
+        # routes every write through a conversion layer. Elsewhere, raw
+        # ANSI escape codes work fine.
+        if os.name == 'nt':
+            colorama.init()
+
+    def render_doc(self, doc, out):
+        # Assemble the whole document in memory and hand it to the
+        # output stream in one write, instead of hitting the terminal
+        # once per line.
+        buf = io.StringIO()
+        super().render_doc(doc, buf)
+        out.write(buf.getvalue())
 
     def write_title_page(self, values, out):
-        known = ['title', 'credit', 'author', 'authors', 'source']
-        center_values = [values.get(i) for i in known]
-
-        print("", file=out)
+        get = values.get
+        center_values = [get(i) for i in self._CENTER_KEYS]
+
+        # `print` resolves its arguments and issues two writes per
+        # call; bind the stream's `write` once and emit newlines
+        # directly.
+        w = out.write
+        w(_NL)
         for val in center_values:
             if val is not None:
-                for l in val.split('\n'):
-                    print(l.center(self.width), file=out)
-            print("", file=out)
-        print("", file=out)
-        print("", file=out)
+                # Batch the centered lines into a single write.
+                w('\n'.join(
+                    [l.center(self.width) for l in val.split('\n')]) +
+                    '\n')
+            w(_NL)
+        w(_NL)
+        w(_NL)
 
-        known = ['date', 'draft date', 'contact', 'copyright']
-        bottom_lines = [values.get(i) for i in known]
+        bottom_lines = [get(i) for i in self._BOTTOM_KEYS]
 
-        _w(out, colorama.Style.DIM, '\n\n'.join([
+        _w(out, _DIM, '\n\n'.join([
             b for b in bottom_lines if b is not None]))
-        print("", file=out)
-        _w(out, colorama.Style.DIM, 80 * '=')
+        w(_NL)
+        _w(out, _DIM, _RULE)
 
     def write_scene_heading(self, text, out):
-        print("", file=out)
-        _w(out, colorama.Fore.WHITE + colorama.Style.BRIGHT, text, True)
+        out.write(_NL)
+        _w(out, _STYLE_HEADING, text, True)
 
     def write_action(self, text, out):
-        print(text, file=out)
+        out.write(text + _NL)
 
     def write_centeredaction(self, text, out):
-        print("", file=out)
-        for line in text.split('\n'):
-            print(line.center(self.width), file=out)
+        out.write('\n' + '\n'.join(
+            [line.center(self.width) for line in text.split('\n')]) +
+            '\n')
 
     def write_character(self, text, out):
-        print("", file=out)
-        _w(out, colorama.Fore.WHITE, "\t\t\t" + text, True)
+        out.write(_NL)
+        _w(out, _STYLE_CHARACTER, "\t\t\t" + text, True)
 
     def write_dialog(self, text, out):
-        for line in text.split('\n'):
-            print("\t" + line, file=out)
+        out.write('\t' + '\n\t'.join(text.split('\n')) + '\n')
 
     def write_parenthetical(self, text, out):
-        for line in text.split('\n'):
-            print("\t\t" + line, file=out)
+        out.write('\t\t' + '\n\t\t'.join(text.split('\n')) + '\n')
 
     def write_transition(self, text, out):
-        print("", file=out)
-        print("\t\t\t\t" + text, file=out)
+        out.write(_NL + "\t\t\t\t" + text + _NL)
 
     def write_lyrics(self, text, out):
-        print("", file=out)
-        _w(out, colorama.Fore.MAGENTA, text, True)
+        out.write(_NL)
+        _w(out, _STYLE_LYRICS, text, True)
 
     def write_pagebreak(self, out):
-        print("", file=out)
-        _w(out, colorama.Style.DIM, 80 * '=')
+        out.write(_NL)
+        _w(out, _DIM, _RULE)
 
     def write_section(self, depth, text, out):
-        print("", file=out)
-        _w(out, colorama.Fore.CYAN, '#' * depth + ' ' + text, True)
+        out.write(_NL)
+        _w(out, _STYLE_SECTION, _section_prefix(depth) + text, True)
 
     def write_synopsis(self, text, out):
-        print("", file=out)
-        _w(out, colorama.Fore.GREEN, '= ' + text, True)
+        out.write(_NL)
+        _w(out, _STYLE_SYNOPSIS, '= ' + text, True)
 
 
 class ConsoleTextRenderer(BaseTextRenderer):
     """A text renderer for producing ANSI colouring."""
-    def _writeStyled(self, style, text):
-        return style + text + colorama.Style.NORMAL
-
+    # Each styled span is built with a single f-string, so there's no
+    # intermediate string or extra method call per emphasis marker.
     def make_italics(self, text):
-        return self._writeStyled(colorama.Style.BRIGHT, text)
+        return f'{_BRIGHT}{text}{_NORMAL}'
 
     def make_bold(self, text):
-        return self._writeStyled(colorama.Style.BRIGHT, text)
+        return f'{_BRIGHT}{text}{_NORMAL}'
 
     def make_underline(self, text):
-        return self._writeStyled(colorama.Style.BRIGHT, text)
+        return f'{_BRIGHT}{text}{_NORMAL}'
 
     def make_note(self, text):
-        out = colorama.Style.DIM + colorama.Fore.MAGENTA
-        out += ' [[ ' + text + ' ]] '
-        out += colorama.Style.RESET_ALL
-        return out
+        return f'{_STYLE_NOTE} [[ {text} ]] {_RESET_ALL}'
@@ -1,6 +1,3 @@
-import sys
-
-
 class JouvenceDocument:
     """Represents a Fountain screenplay in a structured way.
 
@@ -10,6 +7,8 @@ class JouvenceDocument:
     * A list of scenes.
     * Each scene contains a list of paragraphs of various types.
     """
+    __slots__ = ('title_values', 'scenes')
+
     def __init__(self):
         self.title_values = {}
         self.scenes = []
@@ -30,13 +29,12 @@ class JouvenceDocument:
                 a scene with an empty header text. Otherwise, return
                 ``None``.
         """
-        try:
+        if self.scenes:
             return self.scenes[-1]
-        except IndexError:
-            if auto_create:
-                s = self.addScene()
-                return s
-            return None
+        if auto_create:
+            s = self.addScene()
+            return s
+        return None
 
     def lastParagraph(self):
         """Gets the last paragraph of the last scene in the screenplay.
@@ -51,31 +49,50 @@ class JouvenceDocument:
 
 class JouvenceScene:
     """A scene in a screenplay."""
+    __slots__ = ('header', 'paragraphs')
+
     def __init__(self):
         self.header = None
         self.paragraphs = []
-        self._adders = {}
-
-    def __getattr__(self, name):
-        if name.startswith('add'):
-            add_type_name = name[3:]
-            try:
-                adder = self._adders[add_type_name]
-            except KeyError:
-                module = sys.modules[__name__]
-                add_type = getattr(module,
-                                   'TYPE_%s' % add_type_name.upper())
-
-                def _type_adder(_text):
-                    new_p = JouvenceSceneElement(add_type, _text)
-                    self.paragraphs.append(new_p)
-                    return new_p
-
-                adder = _type_adder
-                self._adders[add_type_name] = adder
-            return adder
-        else:
-            raise AttributeError
+
+    def _addElement(self, el_type, text):
+        new_p = JouvenceSceneElement(el_type, text)
+        self.paragraphs.append(new_p)
+        return new_p
+
+    def addAction(self, text):
+        """Adds an action (paragraph with ``TYPE_ACTION`` type)."""
+        return self._addElement(TYPE_ACTION, text)
+
+    def addCenteredAction(self, text):
+        """Adds a centered action (paragraph with ``TYPE_CENTEREDACTION``
+        type)."""
+        return self._addElement(TYPE_CENTEREDACTION, text)
+
+    def addCharacter(self, text):
+        """Adds a character line (paragraph with ``TYPE_CHARACTER`` type)."""
+        return self._addElement(TYPE_CHARACTER, text)
+
+    def addDialog(self, text):
+        """Adds a dialogue line (paragraph with ``TYPE_DIALOG`` type)."""
+        return self._addElement(TYPE_DIALOG, text)
+
+    def addParenthetical(self, text):
+        """Adds a parenthetical (paragraph with ``TYPE_PARENTHETICAL``
+        type)."""
+        return self._addElement(TYPE_PARENTHETICAL, text)
+
+    def addTransition(self, text):
+        """Adds a transition (paragraph with ``TYPE_TRANSITION`` type)."""
+        return self._addElement(TYPE_TRANSITION, text)
+
+    def addLyrics(self, text):
+        """Adds lyrics (paragraph with ``TYPE_LYRICS`` type)."""
+        return self._addElement(TYPE_LYRICS, text)
+
+    def addSynopsis(self, text):
+        """Adds a synopsis (paragraph with ``TYPE_SYNOPSIS`` type)."""
+        return self._addElement(TYPE_SYNOPSIS, text)
 
     def addPageBreak(self):
         """Adds a page break (paragraph with ``TYPE_PAGEBREAK`` type)."""
@@ -86,16 +103,19 @@ class JouvenceScene:
         self.paragraphs.append(JouvenceSceneSection(depth, text))
 
     def lastParagraph(self):
-        try:
+        if self.paragraphs:
             return self.paragraphs[-1]
-        except IndexError:
-            return None
+        return None
 
 
 class JouvenceSceneElement:
     """An element of a screenplay scene, _e.g._ an action, a dialogue
     line, a parenthetical, etc.
     """
+    # A big script produces thousands of these, so don't pay for a
+    # `__dict__` per instance.
+    __slots__ = ('type', 'text')
+
     def __init__(self, el_type, text):
         self.type = el_type
         self.text = text
@@ -107,6 +127,8 @@ class JouvenceSceneElement:
 
 
 class JouvenceSceneSection(JouvenceSceneElement):
+    __slots__ = ('depth',)
+
     def __init__(self, depth, text):
         super().__init__(TYPE_SECTION, text)
         self.depth = depth
@@ -124,28 +146,26 @@ TYPE_SECTION = 8
 TYPE_SYNOPSIS = 9
 
 
+# The element types are contiguous small integers, so their names can
+# be looked up in constant time.
+_TYPE_NAMES = (
+    'ACTION',
+    'CENTEREDACTION',
+    'CHARACTER',
+    'DIALOG',
+    'PARENTHETICAL',
+    'TRANSITION',
+    'LYRICS',
+    'PAGEBREAK',
+    'SECTION',
+    'SYNOPSIS')
+
+
 def _scene_element_type_str(t):
-    if t == TYPE_ACTION:
-        return 'ACTION'
-    if t == TYPE_CENTEREDACTION:
-        return 'CENTEREDACTION'
-    if t == TYPE_CHARACTER:
-        return 'CHARACTER'
-    if t == TYPE_DIALOG:
-        return 'DIALOG'
-    if t == TYPE_PARENTHETICAL:
-        return 'PARENTHETICAL'
-    if t == TYPE_TRANSITION:
-        return 'TRANSITION'
-    if t == TYPE_LYRICS:
-        return 'LYRICS'
-    if t == TYPE_PAGEBREAK:
-        return 'PAGEBREAK'
-    if t == TYPE_SECTION:
-        return 'SECTION'
-    if t == TYPE_SYNOPSIS:
-        return 'SYNOPSIS'
-    raise NotImplementedError()
+    try:
+        return _TYPE_NAMES[t]
+    except IndexError:
+        raise NotImplementedError()
 
 
 def _ellipsis(text, length):
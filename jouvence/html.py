@@ -2,28 +2,44 @@
 Fountain screenplay into a web page, along with other web-related
 features.
 """
+import io
+import re
 import os.path
-from markupsafe import escape
-from .renderer import BaseDocumentRenderer, BaseTextRenderer
+from functools import lru_cache
+from .renderer import BaseDocumentRenderer, BaseTextRenderer, \
+    RE_INLINE, _section_prefix
 
 
-def _elem(out, elem_name, class_name, contents):
-    f = out.write
-    f('<%s' % elem_name)
+def _elem_str(elem_name, class_name, contents):
     if class_name:
-        f(' class="jouvence-%s"' % class_name)
-    f('>')
-    f(contents)
-    f('</%s>\n' % elem_name)
+        return ('<%s class="jouvence-%s">%s</%s>\n' %
+                (elem_name, class_name, contents, elem_name))
+    return '<%s>%s</%s>\n' % (elem_name, contents, elem_name)
 
 
-def _br(text, strip_first=False):
-    lines = text.split('\n')
-    if strip_first and lines[0].strip() == '':
-        lines = lines[1:]
-    return '<br/>\n'.join(lines)
+def _elem(out, elem_name, class_name, contents):
+    # Format the whole element at once so each paragraph costs a
+    # single write.
+    out.write(_elem_str(elem_name, class_name, contents))
 
 
+def _br(text, strip_first=False):
+    if strip_first:
+        if text[:1] == '\n':
+            # Common case: the first line is empty, no allocation
+            # needed to find that out.
+            text = text[1:]
+        else:
+            i = text.find('\n')
+            if i > 0 and not text[:i].strip():
+                text = text[i + 1:]
+    # A single C-level replace, instead of a split/join round-trip.
+    return text.replace('\n', '<br/>\n')
+
+
+# The resources never change while the process runs, so repeated
+# renders read them from memory instead of disk.
+@lru_cache(maxsize=8)
 def _res(filename):
     path = os.path.join(os.path.dirname(__file__), 'resources', filename)
     with open(path, 'r') as fp:
@@ -52,6 +68,13 @@ class HtmlDocumentRenderer(BaseDocumentRenderer):
         super().__init__(HtmlTextRenderer())
         self.standalone = standalone
 
+    def render_doc(self, doc, out):
+        # Build the page in memory and emit it in one write, so files
+        # and sockets aren't hit once per element.
+        buf = io.StringIO()
+        super().render_doc(doc, buf)
+        out.write(buf.getvalue())
+
     def get_css(self):
         """Gets the default CSS screenplay theme that Jouvence uses.
 
@@ -86,20 +109,25 @@ class HtmlDocumentRenderer(BaseDocumentRenderer):
             out.write(_res('html_footer.html'))
 
     def write_title_page(self, values, out):
-        out.write('<div class="jouvence-title-page">\n')
-
-        _elem(out, 'h1', None, _br(values['title']))
-        _elem(out, 'p', 'title-page-heading', _br(values['credit']))
-        _elem(out, 'p', 'title-page-heading', _br(values['author']))
+        # Assemble the whole title page and emit it with a single
+        # writelines call.
+        parts = [
+            '<div class="jouvence-title-page">\n',
+            _elem_str('h1', None, _br(values['title'])),
+            _elem_str('p', 'title-page-heading', _br(values['credit'])),
+            _elem_str('p', 'title-page-heading', _br(values['author']))]
 
         ddate = values.get('date') or values.get('draft date')
         if ddate:
-            _elem(out, 'p', 'title-page-footer', _br(ddate))
+            parts.append(
+                _elem_str('p', 'title-page-footer', _br(ddate)))
         contact = values.get('contact')
         if contact:
-            _elem(out, 'p', 'title-page-footer', _br(contact))
+            parts.append(
+                _elem_str('p', 'title-page-footer', _br(contact)))
 
-        out.write('</div>\n')
+        parts.append('</div>\n')
+        out.writelines(parts)
         self.write_pagebreak(out)
 
     def write_scene_heading(self, text, out):
@@ -130,20 +158,33 @@ class HtmlDocumentRenderer(BaseDocumentRenderer):
         out.write('<hr/>\n')
 
     def write_section(self, depth, text, out):
-        _elem(out, 'p', 'section', '%s %s' % ('#' * depth, text))
+        _elem(out, 'p', 'section', _section_prefix(depth) + text)
 
     def write_synopsis(self, text, out):
         _elem(out, 'p', 'synopsis', text)
 
     def _render_footnotes(self, out):
+        parts = []
         for i, n in enumerate(self.text_renderer.notes):
             note_id = i + 1
-            out.write(
+            parts.append(
                 '<div class="jouvence-note" id="jouvence-note-%d">' %
                 note_id)
             text = '<sup>%d</sup> %s' % (note_id, n)
-            _elem(out, 'p', None, _br(text))
-            out.write('</div>\n')
+            parts.append(_elem_str('p', None, _br(text)))
+            parts.append('</div>\n')
+        out.writelines(parts)
+
+
+# HTML-escaping is fused into the inline markup pass: one combined
+# regex classifies each special character or markup token in a single
+# walk over the text, instead of escaping the whole string and then
+# scanning it all over again for emphasis markers.
+_HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;',
+                 '"': '&#34;', "'": '&#39;'}
+_HTML_ESC_TABLE = str.maketrans(_HTML_ESCAPES)
+_RE_HTML_INLINE = re.compile(
+    RE_INLINE.pattern + r"|(?P<h_char>[&<>\"'])")
 
 
 class HtmlTextRenderer(BaseTextRenderer):
@@ -152,7 +193,23 @@ class HtmlTextRenderer(BaseTextRenderer):
         self.notes = []
 
     def render_text(self, text):
-        return super().render_text(escape(text))
+        if '*' not in text and '_' not in text and '[[' not in text:
+            # No inline markup: a single C-level pass takes care of
+            # the escaping.
+            return text.translate(_HTML_ESC_TABLE)
+        return self._sub_inline(text)
+
+    def _sub_inline(self, text):
+        # The combined pattern escapes HTML specials along the way, so
+        # re-rendering a span's interior through it both styles nested
+        # markup and escapes the text exactly once.
+        return _RE_HTML_INLINE.sub(self._do_make_inline, text)
+
+    def _do_make_inline(self, m):
+        ch = m.group('h_char')
+        if ch is not None:
+            return _HTML_ESCAPES[ch]
+        return super()._do_make_inline(m)
 
     def make_italics(self, text):
         return '<em>%s</em>' % text
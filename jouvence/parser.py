@@ -1,4 +1,5 @@
 import re
+import sys
 import logging
 from .document import TYPE_ACTION
 
@@ -7,6 +8,10 @@ logger = logging.getLogger(__name__)
 
 
 class JouvenceState:
+    # The states are allocated and probed in the parser's hot loop, so
+    # they all declare `__slots__` to keep them dict-free.
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -30,13 +35,23 @@ EOF_STATE = object()
 
 
 # Note how boneyard start/end patterns (/* */) by themselves are
-# considered an empty line.
-RE_EMPTY_LINE = re.compile(r"^(/\*|\*/)?$", re.M)
+# considered an empty line. A plain string comparison is much cheaper
+# than a regex match for such a trivial test.
+def _is_empty_line(line):
+    # Line endings are normalized to `\n` when the script is loaded.
+    return (line in ('', '\n') or
+            line.rstrip('\n') in ('/*', '*/'))
 
 RE_TITLE_KEY_VALUE = re.compile(r"^(?P<key>[\w\s\-]+)\s*:\s*")
 
+# The `match` methods of the hot patterns are bound to module-level
+# names so calling them skips an attribute lookup every time.
+_match_title_kv = RE_TITLE_KEY_VALUE.match
+
 
 class _TitlePageState(JouvenceState):
+    __slots__ = ('_cur_key', '_cur_val')
+
     def __init__(self):
         super().__init__()
         self._cur_key = None
@@ -44,8 +59,8 @@ class _TitlePageState(JouvenceState):
 
     def consume(self, fp, ctx):
         line = fp.peekline()
-        is_match = RE_TITLE_KEY_VALUE.match(line)
-        is_line1_empty = RE_EMPTY_LINE.match(line)
+        is_match = _match_title_kv(line)
+        is_line1_empty = fp.is_empty()
         if not is_match:
             logger.debug("No title page value found on line 1.")
             if not is_line1_empty:
@@ -59,20 +74,22 @@ class _TitlePageState(JouvenceState):
             if not line:
                 return EOF_STATE
 
-            m = RE_TITLE_KEY_VALUE.match(line)
+            m = _match_title_kv(line)
             if m:
                 # Commit current value, start new one.
                 self._commit(ctx)
-                self._cur_key = m.group('key').lower()
-                self._cur_val = line[m.end():]
+                # Interned, so later renderer lookups hit the dict's
+                # identity fast path.
+                self._cur_key = sys.intern(m.group('key').strip().lower())
+                self._cur_val = [line[m.end():]]
             else:
                 # Keep accumulating the value of one of the title page's
                 # values.
-                self._cur_val += line.lstrip()
+                self._cur_val.append(line.lstrip())
 
-            if RE_EMPTY_LINE.match(fp.peekline()):
+            if fp.is_empty():
                 if (self._cur_key and
-                        not self._cur_val and
+                        not any(self._cur_val) and
                         not ctx.document.title_values):
                     # We thought there was a title page, but it turns out
                     # we probably mistakenly matched something like a
@@ -95,36 +112,80 @@ class _TitlePageState(JouvenceState):
 
     def _commit(self, ctx):
         if self._cur_key is not None:
-            val = self._cur_val.rstrip('\r\n')
+            val = ''.join(self._cur_val).rstrip('\r\n')
             ctx.document.title_values[self._cur_key] = val
             self._cur_key = None
             self._cur_val = None
 
 
-RE_SCENE_HEADER_PATTERN = re.compile(
-    r"^(int|ext|est|int/ext|int./ext|i/e)[\s\.]", re.I)
+SCENE_HEADER_PREFIXES = ('int', 'ext', 'est', 'int/ext', 'int./ext',
+                         'i/e')
+
+_SCENE_HEADER_PREFIX_LENS = tuple(
+    (p, len(p)) for p in SCENE_HEADER_PREFIXES)
+
+
+def _is_scene_header_line(line):
+    # Equivalent to matching `^(int|ext|est|int/ext|int./ext|i/e)[\s\.]`
+    # case-insensitively, but with plain string comparisons instead of
+    # walking the regex engine.
+    head = line[:9].lower()  # Longest prefix plus its delimiter.
+    for prefix, plen in _SCENE_HEADER_PREFIX_LENS:
+        if (head.startswith(prefix) and len(head) > plen and
+                (head[plen] == '.' or head[plen].isspace())):
+            return True
+    return False
+
+
+def _strip_sigil(line, ch):
+    # A forced paragraph has exactly one leading sigil; `lstrip` would
+    # eat repeated ones, which also belong to the text.
+    if line[:1] == ch:
+        return line[1:]
+    return line
+
+
+def _clean_line(line, forced, strip_indent=False):
+    # Strip the line ending, optional indenting, and the forcing symbol
+    # with a single slice, instead of allocating an intermediate string
+    # for each strip.
+    end = len(line)
+    while end > 0 and line[end - 1] in '\r\n':
+        end -= 1
+    start = 0
+    if strip_indent:
+        while start < end and line[start].isspace():
+            start += 1
+    if start < end and line[start] == forced:
+        start += 1
+    return line[start:end]
 
 
 class _SceneHeaderState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        lines = fp.peeklines(3)
         return (
-            RE_EMPTY_LINE.match(lines[0]) and
-            RE_SCENE_HEADER_PATTERN.match(lines[1]) and
-            RE_EMPTY_LINE.match(lines[2]))
+            fp.is_empty(0) and
+            fp.is_scene_header(1) and
+            fp.is_empty(2))
 
     def consume(self, fp, ctx):
         fp.readline()  # Get past the blank line.
-        line = fp.readline().rstrip('\r\n')
-        line = line.lstrip('.')  # In case it was forced.
+        # Strip the ending, and the `.` in case it was forced.
+        line = _clean_line(fp.readline(), '.')
         ctx.document.addScene(line)
         return ANY_STATE
 
 
 class _ActionState(JouvenceState):
+    __slots__ = ('text',)
+
     def __init__(self):
         super().__init__()
-        self.text = ''
+        # Accumulate lines in a list and join them on exit, instead of
+        # paying for a new string on every concatenation.
+        self.text = []
 
     def match(self, fp, ctx):
         return True
@@ -141,42 +202,46 @@ class _ActionState(JouvenceState):
                 if fp.last_read_line_no == 0:
                     continue
 
-                line = line.lstrip('!')  # In case it was forced.
+                line = _strip_sigil(line, '!')  # In case it was forced.
                 is_first_line = False
 
             # If the next line is empty, strip the carriage return from
             # the line we just got because it's probably gonna be the
             # last one.
-            if RE_EMPTY_LINE.match(fp.peekline()):
-                self.text += line.rstrip("\r\n")
+            if fp.is_empty():
+                self.text.append(line.rstrip("\r\n"))
                 break
             # ...otherwise, add the line with in full.
-            self.text += line
+            self.text.append(line)
 
         return ANY_STATE
 
     def exit(self, ctx, next_state):
-        last_para = ctx.document.lastParagraph()
+        text = ''.join(self.text)
+        doc = ctx.document
+        last_para = doc.lastParagraph()
         if last_para and last_para.type == TYPE_ACTION:
-            last_para.text += '\n' + self.text
+            last_para.text += '\n' + text
         else:
-            ctx.document.lastScene().addAction(self.text)
+            doc.lastScene().addAction(text)
 
 
 RE_CENTERED_LINE = re.compile(r"^\s*>\s*.*\s*<\s*$")
+_match_centered = RE_CENTERED_LINE.match
 
 
 class _CenteredActionState(JouvenceState):
+    __slots__ = ('text', '_aborted')
+
     def __init__(self):
         super().__init__()
-        self.text = ''
+        self.text = []
         self._aborted = False
 
     def match(self, fp, ctx):
-        lines = fp.peeklines(2)
         return (
-            RE_EMPTY_LINE.match(lines[0]) and
-            RE_CENTERED_LINE.match(lines[1]))
+            fp.is_empty(0) and
+            _match_centered(fp.peekline(1)))
 
     def consume(self, fp, ctx):
         snapshot = fp.snapshot()
@@ -204,68 +269,78 @@ class _CenteredActionState(JouvenceState):
                 # Remove wrapping `>`/`<`, and spaces.
                 clean_line = clean_line[1:-1].strip()
 
-            if RE_EMPTY_LINE.match(fp.peekline()):
-                self.text += clean_line
+            if fp.is_empty():
+                self.text.append(clean_line)
                 break
-            self.text += clean_line + eol
+            self.text.append(clean_line + eol)
 
         return ANY_STATE
 
     def exit(self, ctx, next_state):
         if not self._aborted:
-            ctx.document.lastScene().addCenteredAction(self.text)
+            ctx.document.lastScene().addCenteredAction(''.join(self.text))
 
 
 RE_CHARACTER_LINE = re.compile(r"^\s*[A-Z][A-Z\-\._\s]+\s*(\(.*\))?$")
 
+# Combined pattern so the classifier enters the regex engine once per
+# line instead of once per pattern. The two alternatives are mutually
+# exclusive (a parenthetical starts with `(`, a character line with an
+# uppercase letter).
+RE_CHARACTER_OR_PAREN = re.compile(
+    r"(?P<paren>^\s*\(.*\)\s*$)|"
+    r"(?P<char>^\s*[A-Z][A-Z\-\._\s]+\s*(\(.*\))?$)")
+
 
 class _CharacterState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        lines = fp.peeklines(3)
-        return (RE_EMPTY_LINE.match(lines[0]) and
-                RE_CHARACTER_LINE.match(lines[1]) and
-                not RE_EMPTY_LINE.match(lines[2]))
+        return (fp.is_empty(0) and
+                fp.is_character(1) and
+                not fp.is_empty(2))
 
     def consume(self, fp, ctx):
         fp.readline()  # Get past the empty line.
-        line = fp.readline().rstrip('\r\n')
-        line = line.lstrip()  # Remove indenting.
-        line = line.lstrip('@')  # In case it was forced.
+        # Strip the ending, the indenting, and the `@` in case it was
+        # forced.
+        line = _clean_line(fp.readline(), '@', strip_indent=True)
         ctx.document.lastScene().addCharacter(line)
-        return [_ParentheticalState, _DialogState]
+        return _CHARACTER_NEXT_STATES
 
 
 RE_PARENTHETICAL_LINE = re.compile(r"^\s*\(.*\)\s*$")
 
 
 class _ParentheticalState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
         # We only get here from a `_CharacterState` so we know the previous
         # one is already that.
-        line = fp.peekline()
-        return RE_PARENTHETICAL_LINE.match(line)
+        return fp.is_parenthetical()
 
     def consume(self, fp, ctx):
         line = fp.readline().lstrip().rstrip('\r\n')
         ctx.document.lastScene().addParenthetical(line)
 
-        next_line = fp.peekline()
-        if not RE_EMPTY_LINE.match(next_line):
+        if not fp.is_empty():
             return _DialogState()
 
         return ANY_STATE
 
 
 class _DialogState(JouvenceState):
+    __slots__ = ('text',)
+
     def __init__(self):
         super().__init__()
-        self.text = ''
+        self.text = []
 
     def match(self, fp, ctx):
         # We only get here from a `_CharacterState` or `_ParentheticalState`
         # so we just need to check there's some text.
-        line = fp.peekline()
-        return not RE_EMPTY_LINE.match(line)
+        return not fp.is_empty()
 
     def consume(self, fp, ctx):
         while True:
@@ -277,27 +352,33 @@ class _DialogState(JouvenceState):
 
             # Next we could be either continuing the dialog line, going to
             # a parenthetical, or exiting dialog altogether.
-            next_line = fp.peekline()
-
-            if RE_PARENTHETICAL_LINE.match(next_line):
-                self.text += line.rstrip('\r\n')
+            if fp.is_parenthetical():
+                self.text.append(line.rstrip('\r\n'))
                 return _ParentheticalState()
 
-            if RE_EMPTY_LINE.match(next_line):
-                self.text += line.rstrip('\r\n')
+            if fp.is_empty():
+                self.text.append(line.rstrip('\r\n'))
                 break
-            self.text += line
+            self.text.append(line)
 
         return ANY_STATE
 
     def exit(self, ctx, next_state):
-        ctx.document.lastScene().addDialog(self.text.rstrip('\r\n'))
+        ctx.document.lastScene().addDialog(
+            ''.join(self.text).rstrip('\r\n'))
+
+
+# What can follow a character line. A constant tuple, so consuming a
+# character line doesn't allocate a new list every time.
+_CHARACTER_NEXT_STATES = (_ParentheticalState, _DialogState)
 
 
 class _LyricsState(JouvenceState):
+    __slots__ = ('text', '_aborted')
+
     def __init__(self):
         super().__init__()
-        self.text = ''
+        self.text = []
         self._aborted = False
 
     # No `match` method, this can only be forced.
@@ -312,54 +393,68 @@ class _LyricsState(JouvenceState):
                 return EOF_STATE
 
             if line.startswith('~'):
-                line = line.lstrip('~')
+                line = line[1:]
             else:
                 logger.debug("Rolling back lyrics into action paragraph.")
                 fp.restore(snapshot)
                 self._aborted = True
                 return _ActionState()
 
-            if RE_EMPTY_LINE.match(fp.peekline()):
-                self.text += line.rstrip('\r\n')
+            if fp.is_empty():
+                self.text.append(line.rstrip('\r\n'))
                 break
-            self.text += line
+            self.text.append(line)
 
         return ANY_STATE
 
     def exit(self, ctx, next_state):
         if not self._aborted:
-            ctx.document.lastScene().addLyrics(self.text)
+            ctx.document.lastScene().addLyrics(''.join(self.text))
 
 
-RE_TRANSITION_LINE = re.compile(r"^\s*[^a-z]+TO\:$")
+def _is_transition_line(line):
+    # Equivalent to matching `^\s*[^a-z]+TO:$`: something that ends
+    # with `TO:` with no trailing garbage, no lowercase letter
+    # anywhere, and at least one character -- whitespace included,
+    # since the regex let it count towards `[^a-z]+` -- before the
+    # `TO:`. Plain string tests, no regex engine involved.
+    line = line.rstrip('\n')
+    if len(line) <= 3 or not line.endswith('TO:'):
+        return False
+    return not any('a' <= c <= 'z' for c in line)
 
 
 class _TransitionState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        lines = fp.peeklines(3)
         return (
-            RE_EMPTY_LINE.match(lines[0]) and
-            RE_TRANSITION_LINE.match(lines[1]) and
-            RE_EMPTY_LINE.match(lines[2]))
+            fp.is_empty(0) and
+            _is_transition_line(fp.peekline(1)) and
+            fp.is_empty(2))
 
     def consume(self, fp, ctx):
         fp.readline()  # Get past the empty line.
         line = fp.readline().lstrip().rstrip('\r\n')
-        line = line.lstrip('>')  # In case it was forced.
+        line = _strip_sigil(line, '>')  # In case it was forced.
         ctx.document.lastScene().addTransition(line)
         return ANY_STATE
 
 
-RE_PAGE_BREAK_LINE = re.compile(r"^\=\=\=+$")
+def _is_page_break_line(line):
+    # A page break is three or more `=` and nothing else.
+    line = line.rstrip('\r\n')
+    return len(line) >= 3 and not line.strip('=')
 
 
 class _PageBreakState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        lines = fp.peeklines(3)
         return (
-            RE_EMPTY_LINE.match(lines[0]) and
-            RE_PAGE_BREAK_LINE.match(lines[1]) and
-            RE_EMPTY_LINE.match(lines[2]))
+            fp.is_empty(0) and
+            _is_page_break_line(fp.peekline(1)) and
+            fp.is_empty(2))
 
     def consume(self, fp, ctx):
         fp.readline()
@@ -369,6 +464,8 @@ class _PageBreakState(JouvenceState):
 
 
 class _ForcedParagraphStates(JouvenceState):
+    __slots__ = ('_state_cls', '_consume_empty_line')
+
     STATE_SYMBOLS = {
         '.': _SceneHeaderState,
         '!': _ActionState,
@@ -383,20 +480,20 @@ class _ForcedParagraphStates(JouvenceState):
         self._consume_empty_line = False
 
     def match(self, fp, ctx):
-        lines = fp.peeklines(2)
-        symbol = lines[1][:1]
-        if (RE_EMPTY_LINE.match(lines[0]) and
-                symbol in self.STATE_SYMBOLS):
+        line = fp.peekline(1)
+        symbol = line[:1]
+        state_cls = self.STATE_SYMBOLS.get(symbol)
+        if state_cls is not None and fp.is_empty(0):
             # Special case: don't force a transition state if it's
             # really some centered text.
-            if symbol == '>' and RE_CENTERED_LINE.match(lines[1]):
+            if symbol == '>' and _match_centered(line):
                 return False
             # Special case: don't force a scene header if it's an action
             # text that starts with, say, an ellipsis.
-            if symbol == '.' and len(lines[1]) > 1 and not lines[1][1].isalnum():
+            if symbol == '.' and len(line) > 1 and not line[1].isalnum():
                 return False
 
-            self._state_cls = self.STATE_SYMBOLS[symbol]
+            self._state_cls = state_cls
 
             # Special case: for forced action paragraphs, don't leave
             # the blank line there.
@@ -414,34 +511,37 @@ class _ForcedParagraphStates(JouvenceState):
 
 RE_BONEYARD_START = re.compile(r"^/\*")
 RE_BONEYARD_END = re.compile(r"\*/\s*$")
+_match_boneyard_start = RE_BONEYARD_START.match
+_match_boneyard_end = RE_BONEYARD_END.match
 
 
 class _BoneyardState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        return RE_BONEYARD_START.match(fp.peekline())
+        return _match_boneyard_start(fp.peekline())
 
     def consume(self, fp, ctx):
-        while True:
-            fp.readline()
-            if RE_BONEYARD_END.match(fp.peekline()):
-                break
+        fp.skip_boneyard()
         return ANY_STATE
 
 
 RE_SECTION_LINE = re.compile(r"^(?P<depth>#+)\s*")
+_match_section = RE_SECTION_LINE.match
 
 
 class _SectionState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        lines = fp.peeklines(3)
-        return (RE_EMPTY_LINE.match(lines[0]) and
-                RE_SECTION_LINE.match(lines[1]) and
-                RE_EMPTY_LINE.match(lines[2]))
+        return (fp.is_empty(0) and
+                _match_section(fp.peekline(1)) and
+                fp.is_empty(2))
 
     def consume(self, fp, ctx):
         fp.readline()
         line = fp.readline()
-        m = RE_SECTION_LINE.match(line)
+        m = _match_section(line)
         depth = len(m.group('depth'))
         line = line[m.end():].rstrip('\r\n')
         ctx.document.lastScene().addSection(depth, line)
@@ -449,14 +549,16 @@ class _SectionState(JouvenceState):
 
 
 RE_SYNOPSIS_LINE = re.compile(r"^=[^=]")
+_match_synopsis = RE_SYNOPSIS_LINE.match
 
 
 class _SynopsisState(JouvenceState):
+    __slots__ = ()
+
     def match(self, fp, ctx):
-        lines = fp.peeklines(3)
-        return (RE_EMPTY_LINE.match(lines[0]) and
-                RE_SYNOPSIS_LINE.match(lines[1]) and
-                RE_EMPTY_LINE.match(lines[2]))
+        return (fp.is_empty(0) and
+                _match_synopsis(fp.peekline(1)) and
+                fp.is_empty(2))
 
     def consume(self, fp, ctx):
         fp.readline()
@@ -468,12 +570,14 @@ class _SynopsisState(JouvenceState):
 
 
 class _EmptyLineState(JouvenceState):
+    __slots__ = ('line_count',)
+
     def __init__(self):
         super().__init__()
         self.line_count = 0
 
     def match(self, fp, ctx):
-        return RE_EMPTY_LINE.match(fp.peekline())
+        return fp.is_empty()
 
     def consume(self, fp, ctx):
         line = fp.readline()
@@ -482,18 +586,19 @@ class _EmptyLineState(JouvenceState):
         # - don't take into account the fake blank at 0
         # - don't take into account boneyard endings
         if (fp.last_read_line_no > 0 and
-                not RE_BONEYARD_END.match(line)):
+                not _match_boneyard_end(line)):
             self.line_count += 1
         return ANY_STATE
 
     def exit(self, ctx, next_state):
         if self.line_count > 0:
             text = self.line_count * '\n'
-            last_para = ctx.document.lastParagraph()
+            doc = ctx.document
+            last_para = doc.lastParagraph()
             if last_para and last_para.type == TYPE_ACTION:
                 last_para.text += text
             else:
-                ctx.document.lastScene().addAction(text[1:])
+                doc.lastScene().addAction(text[1:])
 
 
 ROOT_STATES = [
@@ -511,73 +616,214 @@ ROOT_STATES = [
 ]
 
 
-class _PeekableFile:
-    def __init__(self, fp):
-        self.last_read_line_no = 0
-        self._fp = fp
+def _computeRootStatesFor(c):
+    # Compute which root states could possibly match a paragraph whose
+    # first line starts with character `c`, assuming the line before it
+    # is a truly blank line. The order must follow `ROOT_STATES`.
+    states = []
+    if c:
+        if c in '.!@~>':
+            states.append(_ForcedParagraphStates)
+        if c in 'iIeE':
+            states.append(_SceneHeaderState)
+        if c.isupper() or c in ' \t':
+            states.append(_CharacterState)
+        if not ('a' <= c <= 'z'):
+            # The transition pattern accepts any non-lowercase prefix.
+            states.append(_TransitionState)
+        if c == '=':
+            states.append(_PageBreakState)
+        if c == '>' or c in ' \t':
+            states.append(_CenteredActionState)
+        if c == '#':
+            states.append(_SectionState)
+        if c == '=':
+            states.append(_SynopsisState)
+    states.append(_EmptyLineState)
+    states.append(_ActionState)
+    return states
+
+
+# Jump table keyed on the first character of the probed line, filled
+# lazily since most scripts only ever use a handful of characters there.
+_ROOT_DISPATCH = {}
+
+
+def _getRootStatesFor(c):
+    try:
+        return _ROOT_DISPATCH[c]
+    except KeyError:
+        states = _computeRootStatesFor(c)
+        _ROOT_DISPATCH[c] = states
+        return states
+
+
+# States that keep no per-paragraph data can be instantiated once and
+# re-used for every probe, instead of allocating a fresh instance each
+# time the state machine tries to match them.
+_STATE_SINGLETONS = {
+    cls: cls()
+    for cls in (
+        _SceneHeaderState,
+        _CharacterState,
+        _ParentheticalState,
+        _TransitionState,
+        _PageBreakState,
+        _BoneyardState,
+        _SectionState,
+        _SynopsisState)}
+
+
+class _PeekableLines:
+    """A cursor over the whole script, pre-split into lines.
+
+    The lines are classified against the hot parser patterns once,
+    up-front, so that states can test cheap per-line flags instead of
+    re-running the same regexes every time they peek at a line.
+    """
+    __slots__ = ('lines', '_pos', '_has_blank0',
+                 '_empty', '_scene', '_character', '_paren')
+
+    def __init__(self, lines):
+        self.lines = lines
+        self._pos = 0
         # This is for adding a "fake" blank line at the beginning of the
         # file, to help with matching things on the first line.
-        # (has blank line, is blank line unread)
-        self._blankAt0 = (False, False)
+        self._has_blank0 = False
+        self._classify()
+
+    def _classify(self):
+        num_lines = len(self.lines)
+        empty = bytearray(num_lines)
+        scene = bytearray(num_lines)
+        character = bytearray(num_lines)
+        paren = bytearray(num_lines)
+        # Bind the match methods to locals so the hot loop doesn't do
+        # an attribute lookup per line per pattern.
+        match_char_or_paren = RE_CHARACTER_OR_PAREN.match
+        for i, line in enumerate(self.lines):
+            if _is_empty_line(line):
+                empty[i] = 1
+                continue
+            if _is_scene_header_line(line):
+                scene[i] = 1
+            # The first real character decides almost every line: only
+            # an uppercase letter (character) or an opening bracket
+            # (parenthetical) warrants entering the regex engine.
+            c = line.lstrip()[:1]
+            if c == '(' or 'A' <= c <= 'Z':
+                m = match_char_or_paren(line)
+                if m:
+                    if m.lastgroup == 'char':
+                        character[i] = 1
+                    else:
+                        paren[i] = 1
+        self._empty = empty
+        self._scene = scene
+        self._character = character
+        self._paren = paren
+
+    @property
+    def last_read_line_no(self):
+        if self._has_blank0:
+            return self._pos - 1
+        return self._pos
 
     def readline(self):
-        if self._blankAt0[1]:
-            self._blankAt0 = (True, False)
-            self.last_read_line_no = 0
-            return '\n'
-
-        data = self._fp.readline()
-        self.last_read_line_no += 1
-        return data
-
-    def peekline(self):
-        if self._blankAt0[1]:
-            return '\n'
-
-        pos = self._fp.tell()
-        line = self._fp.readline()
-        self._fp.seek(pos)
+        try:
+            line = self.lines[self._pos]
+        except IndexError:
+            return ''
+        self._pos += 1
         return line
 
+    def peekline(self, offset=0):
+        try:
+            return self.lines[self._pos + offset]
+        except IndexError:
+            return ''
+
+    def is_eof(self):
+        return self._pos >= len(self.lines)
+
     def peeklines(self, count):
-        pos = self._fp.tell()
-        lines = []
-        if self._blankAt0[1]:
-            lines.append('\n')
-            count -= 1
-        for i in range(count):
-            lines.append(self._fp.readline())
-        self._fp.seek(pos)
-        return lines
+        pos = self._pos
+        num_lines = len(self.lines)
+        return [self.lines[pos + i] if pos + i < num_lines else ''
+                for i in range(count)]
+
+    def is_empty(self, offset=0):
+        # The end of the file counts as an empty line, just like
+        # `RE_EMPTY_LINE` matches the empty string.
+        i = self._pos + offset
+        if i >= len(self.lines):
+            return True
+        return self._empty[i] != 0
+
+    def is_scene_header(self, offset=0):
+        i = self._pos + offset
+        if i >= len(self.lines):
+            return False
+        return self._scene[i] != 0
+
+    def is_character(self, offset=0):
+        i = self._pos + offset
+        if i >= len(self.lines):
+            return False
+        return self._character[i] != 0
+
+    def is_parenthetical(self, offset=0):
+        i = self._pos + offset
+        if i >= len(self.lines):
+            return False
+        return self._paren[i] != 0
+
+    def skip_boneyard(self):
+        # Skip over the current boneyard in one go, leaving the cursor
+        # on the closing `*/` line (which counts as an empty line), with
+        # plain string tests instead of a readline/regex pair per line.
+        lines = self.lines
+        num_lines = len(lines)
+        i = self._pos + 1
+        while i < num_lines:
+            line = lines[i]
+            if line[:2] == '*/' and not line[2:].strip():
+                break
+            i += 1
+        self._pos = i
 
     def snapshot(self):
-        return (self._fp.tell(), self._blankAt0, self.last_read_line_no)
+        return self._pos
 
     def restore(self, snapshot):
-        self._fp.seek(snapshot[0])
-        self._blankAt0 = snapshot[1]
-        self.last_read_line_no = snapshot[2]
+        self._pos = snapshot
 
     def reset(self):
-        self._fp.seek(0)
-        if self._blankAt0[0]:
-            self._blankAt0 = (True, True)
-            self.last_read_line_no = -1
-        else:
-            self._blankAt0 = (False, False)
-            self.last_read_line_no = 0
+        self._pos = 0
 
     def _addBlankAt0(self):
-        if self._fp.tell() != 0:
+        if self._pos != 0:
             raise Exception(
                 "Can't add blank line at 0 if reading has started.")
-        self._blankAt0 = (True, True)
-        self.last_read_line_no = -1
+        if self._has_blank0:
+            return
+        self.lines.insert(0, '\n')
+        self._empty.insert(0, 1)
+        self._scene.insert(0, 0)
+        self._character.insert(0, 0)
+        self._paren.insert(0, 0)
+        self._has_blank0 = True
 
 
 class _JouvenceStateMachine:
-    def __init__(self, fp, doc):
-        self.fp = _PeekableFile(fp)
+    __slots__ = ('fp', 'state', 'document')
+
+    def __init__(self, text, doc):
+        # Normalize Windows line endings up-front, so the rest of the
+        # parser only ever deals with `\n` and every `rstrip('\r\n')`
+        # has one character to look at.
+        self.fp = _PeekableLines(
+            text.replace('\r\n', '\n').splitlines(keepends=True))
         self.state = None
         self.document = doc
 
@@ -593,17 +839,48 @@ class _JouvenceStateMachine:
         except Exception as ex:
             raise JouvenceParserError(self.line_no, str(ex)) from ex
 
+    def _matchNextState(self, next_states):
+        if next_states is ROOT_STATES:
+            # Narrow down the candidates from the first character of the
+            # probed paragraph. This only applies after a truly blank
+            # line -- boneyard markers also count as "empty" but need
+            # the full candidate list.
+            if self.fp.peekline() in ('', '\n'):
+                next_states = _getRootStatesFor(self.fp.peekline(1)[:1])
+        pos = self.fp.snapshot()
+        logger.debug("Trying to match next state from: %s" %
+                     [t.__name__ for t in next_states])
+        for sc in next_states:
+            s = _STATE_SINGLETONS.get(sc) or sc()
+            if s.match(self.fp, self):
+                logger.debug("Matched state %s" % s.__class__.__name__)
+                self.fp.restore(pos)
+                return s
+        raise Exception("Can't match following state after: %s" %
+                        self.state)
+
     def _doRun(self):
         # Start parsing! Here we try to do a mostly-forward-only parser with
         # non overlapping regexes to make it decently fast.
-        self.state = _TitlePageState()
+        if _match_title_kv(self.fp.peekline()):
+            self.state = _TitlePageState()
+        else:
+            # Common case: the script has no title page at all. Skip the
+            # title page state entirely and match the first real state
+            # right away.
+            logger.debug("No title page value found on line 1.")
+            if not self.fp.is_empty():
+                # Add a fake empty line at the beginning of the text if
+                # there's not one already. This makes state matching easier.
+                self.fp._addBlankAt0()
+            self.state = self._matchNextState(ROOT_STATES)
         while True:
             logger.debug("State '%s' consuming from '%s'..." %
                          (self.state.__class__.__name__, self.fp.peekline()))
             res = self.state.consume(self.fp, self)
 
             # See if we reached the end of the file.
-            if not self.fp.peekline():
+            if self.fp.is_eof():
                 logger.debug("Reached end of line... ending parsing.")
                 res = EOF_STATE
 
@@ -617,26 +894,13 @@ class _JouvenceStateMachine:
                     "states, or `EOF_STATE` if they reached the end of the "
                     "file." % self.state.__class__.__name__)
 
-            elif res is ANY_STATE or isinstance(res, list):
+            elif res is ANY_STATE or isinstance(res, tuple):
                 # State wants to exit, we need to figure out what is the
                 # next state.
-                pos = self.fp._fp.tell()
                 next_states = res
                 if next_states is ANY_STATE:
                     next_states = ROOT_STATES
-                logger.debug("Trying to match next state from: %s" %
-                             [t.__name__ for t in next_states])
-                for sc in next_states:
-                    s = sc()
-                    if s.match(self.fp, self):
-                        logger.debug("Matched state %s" %
-                                     s.__class__.__name__)
-                        self.fp._fp.seek(pos)
-                        res = s
-                        break
-                else:
-                    raise Exception("Can't match following state after: %s" %
-                                    self.state)
+                res = self._matchNextState(next_states)
 
                 # Handle the current state before we move on to the new one.
                 if self.state:
@@ -673,21 +937,15 @@ class JouvenceParser:
         """
         if isinstance(filein, str):
             with open(filein, 'r') as fp:
-                return self._doParse(fp)
-        else:
-            return self._doParse(fp)
+                return self.parseString(fp.read())
+        return self.parseString(filein.read())
 
     def parseString(self, text):
         """Parses a string. Returns a
         :class:`~jouvence.document.JouvenceDocument` instance.
         """
-        import io
-        with io.StringIO(text) as fp:
-            return self._doParse(fp)
-
-    def _doParse(self, fp):
         from .document import JouvenceDocument
         doc = JouvenceDocument()
-        machine = _JouvenceStateMachine(fp, doc)
+        machine = _JouvenceStateMachine(text, doc)
         machine.run()
         return doc
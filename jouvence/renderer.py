@@ -1,16 +1,45 @@
 import re
+from functools import lru_cache
 from jouvence.document import (
     TYPE_ACTION, TYPE_CENTEREDACTION, TYPE_CHARACTER, TYPE_DIALOG,
     TYPE_PARENTHETICAL, TYPE_TRANSITION, TYPE_LYRICS, TYPE_PAGEBREAK,
     TYPE_SECTION, TYPE_SYNOPSIS)
 
 
+def _make_missing_stub(name):
+    def _missing(*args, **kwargs):
+        raise NotImplementedError(name)
+    return _missing
+
+
+# Section depths repeat across a document, so the '#' prefixes are
+# worth caching instead of rebuilding for every heading.
+@lru_cache(maxsize=8)
+def _section_prefix(depth):
+    return '#' * depth + ' '
+
+
 class BaseDocumentRenderer:
     """The base class for document renderers.
 
     Document renderers are given a document to transform into whatever
     format they're responsible for.
     """
+    # Shared paragraph dispatch table, so instantiating a renderer
+    # doesn't rebuild a dict of bound methods every time.
+    _para_rdrs = {
+        TYPE_ACTION: 'write_action',
+        TYPE_CENTEREDACTION: 'write_centeredaction',
+        TYPE_CHARACTER: 'write_character',
+        TYPE_DIALOG: 'write_dialog',
+        TYPE_PARENTHETICAL: 'write_parenthetical',
+        TYPE_TRANSITION: 'write_transition',
+        TYPE_LYRICS: 'write_lyrics',
+        TYPE_PAGEBREAK: 'write_pagebreak',
+        TYPE_SECTION: 'write_section',
+        TYPE_SYNOPSIS: 'write_synopsis',
+    }
+
     def __init__(self, text_renderer=None):
         """Initializes the document renderer.
 
@@ -22,19 +51,9 @@ class BaseDocumentRenderer:
         self.text_renderer = text_renderer
         if not text_renderer:
             self.text_renderer = NullTextRenderer()
-
-        self._para_rdrs = {
-            TYPE_ACTION: self.write_action,
-            TYPE_CENTEREDACTION: self.write_centeredaction,
-            TYPE_CHARACTER: self.write_character,
-            TYPE_DIALOG: self.write_dialog,
-            TYPE_PARENTHETICAL: self.write_parenthetical,
-            TYPE_TRANSITION: self.write_transition,
-            TYPE_LYRICS: self.write_lyrics,
-            TYPE_PAGEBREAK: self.write_pagebreak,
-            TYPE_SECTION: self.write_section,
-            TYPE_SYNOPSIS: self.write_synopsis,
-        }
+        # Built on first use, since subclasses may not implement every
+        # writer until then.
+        self._para_dispatch = None
 
     def _tr(self, text):
         return self.text_renderer.render_text(text)
@@ -66,16 +85,32 @@ class BaseDocumentRenderer:
         self.write_title_page(clean_values, out)
 
     def render_scene(self, scene, out):
+        dispatch = self._para_dispatch
+        if dispatch is None:
+            dispatch = self._para_dispatch = self._buildParaDispatch()
         if scene.header is not None:
             self.write_scene_heading(scene.header, out)
         for p in scene.paragraphs:
-            rdr_func = self._para_rdrs[p.type]
-            if p.type == TYPE_PAGEBREAK:
-                rdr_func(out)
-            elif p.type == TYPE_SECTION:
-                rdr_func(p.depth, self._tr(p.text), out)
+            dispatch[p.type](p, out)
+
+    def _buildParaDispatch(self):
+        # Pre-resolve each paragraph type to a small closure that knows
+        # the writer's argument shape, so the render loop is a single
+        # indexed call per paragraph instead of a dict lookup plus type
+        # branching.
+        tr = self._tr
+        dispatch = [None] * len(self._para_rdrs)
+        for p_type, name in self._para_rdrs.items():
+            wrt = getattr(self, name)
+            if p_type == TYPE_PAGEBREAK:
+                dispatch[p_type] = lambda p, out, wrt=wrt: wrt(out)
+            elif p_type == TYPE_SECTION:
+                dispatch[p_type] = \
+                    lambda p, out, wrt=wrt: wrt(p.depth, tr(p.text), out)
             else:
-                rdr_func(self._tr(p.text), out)
+                dispatch[p_type] = \
+                    lambda p, out, wrt=wrt: wrt(tr(p.text), out)
+        return dispatch
 
     def write_header(self, doc, out):
         pass
@@ -83,51 +118,29 @@ class BaseDocumentRenderer:
     def write_footer(self, doc, out):
         pass
 
-    def write_title_page(self, values, out):
-        raise NotImplementedError()
-
-    def write_scene_heading(self, text, out):
-        raise NotImplementedError()
-
-    def write_action(self, text, out):
-        raise NotImplementedError()
-
-    def write_centeredaction(self, text, out):
-        raise NotImplementedError()
-
-    def write_character(self, text, out):
-        raise NotImplementedError()
-
-    def write_dialog(self, text, out):
-        raise NotImplementedError()
-
-    def write_parenthetical(self, text, out):
-        raise NotImplementedError()
-
-    def write_transition(self, text, out):
-        raise NotImplementedError()
-
-    def write_lyrics(self, text, out):
-        raise NotImplementedError()
-
-    def write_pagebreak(self, out):
-        raise NotImplementedError()
-
-    def write_section(self, depth, text, out):
-        raise NotImplementedError()
-
-    def write_synopsis(self, text, out):
-        raise NotImplementedError()
-
-
-RE_ITALICS = re.compile(
-    r"(?P<before>^|\s)(?P<esc>\\)?\*(?P<text>.*[^\s\*])\*(?=[^a-zA-Z0-9\*]|$)")
-RE_BOLD = re.compile(
-    r"(?P<before>^|\s)(?P<esc>\\)?\*\*(?P<text>.*[^\s])\*\*(?=[^a-zA-Z0-9]|$)")
-RE_UNDERLINE = re.compile(
-    r"(?P<before>^|\s)(?P<esc>\\)?_(?P<text>.*[^\s])_(?=[^a-zA-Z0-9]|$)")
-
-RE_NOTE = re.compile(r"\[\[(?P<text>.+?)\]\]", re.DOTALL)
+    def __getattr__(self, name):
+        # The `write_*` methods (`write_title_page`, `write_action`,
+        # `write_dialog`, etc.) must be implemented by subclasses; a
+        # single fallback replaces a dozen stubs that would otherwise
+        # just raise. Return a callable that raises when invoked, so
+        # `hasattr`/`getattr` keep behaving like the stubs existed.
+        if name.startswith('write_'):
+            return _make_missing_stub(name)
+        raise AttributeError(name)
+
+
+# All the inline formatting patterns are fused into one alternation so
+# rendering a piece of text walks it once instead of once per pattern.
+# The bold alternative must come before the italics one so that double
+# asterisks are caught first.
+RE_INLINE = re.compile(
+    r"(?P<b_before>^|\s)(?P<b_esc>\\)?\*\*(?P<b_text>.*[^\s])\*\*"
+    r"(?=[^a-zA-Z0-9]|$)|"
+    r"(?P<i_before>^|\s)(?P<i_esc>\\)?\*(?P<i_text>.*[^\s\*])\*"
+    r"(?=[^a-zA-Z0-9\*]|$)|"
+    r"(?P<u_before>^|\s)(?P<u_esc>\\)?_(?P<u_text>.*[^\s])_"
+    r"(?=[^a-zA-Z0-9]|$)|"
+    r"(?s:\[\[(?P<n_text>.+?)\]\])")
 
 
 class BaseTextRenderer:
@@ -136,49 +149,48 @@ class BaseTextRenderer:
     """
     def render_text(self, text):
         """Processes the given text, and returns the formatted data."""
-        # Replace bold stuff to catch double asterisks.
-        text = RE_BOLD.sub(self._do_make_bold, text)
-        text = RE_ITALICS.sub(self._do_make_italics, text)
-        text = RE_UNDERLINE.sub(self._do_make_underline, text)
-        text = RE_NOTE.sub(self._do_make_note, text)
-
-        return text
-
-    def _do_make_italics(self, m):
-        if m.group('esc'):
-            return m.group('before') + '*' + m.group('text') + '*'
-        return (
-            m.group('before') +
-            self.make_italics(m.group('text')))
-
-    def _do_make_bold(self, m):
-        if m.group('esc'):
-            return m.group('before') + '**' + m.group('text') + '**'
-        return (
-            m.group('before') +
-            self.make_bold(m.group('text')))
-
-    def _do_make_underline(self, m):
-        if m.group('esc'):
-            return m.group('before') + '_' + m.group('text') + '_'
-        return (
-            m.group('before') +
-            self.make_underline(m.group('text')))
-
-    def _do_make_note(self, m):
-        return self.make_note(m.group('text'))
-
-    def make_italics(self, text):
-        raise NotImplementedError()
-
-    def make_bold(self, text):
-        raise NotImplementedError()
-
-    def make_underline(self, text):
-        raise NotImplementedError()
-
-    def make_note(self, text):
-        raise NotImplementedError()
+        # Most lines contain no inline markup at all; don't even enter
+        # the regex engine for those.
+        if '*' not in text and '_' not in text and '[[' not in text:
+            return text
+        return self._sub_inline(text)
+
+    def _sub_inline(self, text):
+        # Also used to re-render the interior of a matched span, so
+        # that nested markup (e.g. italics inside an underline) gets
+        # styled the way the old one-pass-per-style pipeline did.
+        return RE_INLINE.sub(self._do_make_inline, text)
+
+    def _do_make_inline(self, m):
+        text = m.group('b_text')
+        if text is not None:
+            if m.group('b_esc'):
+                return (m.group('b_before') + '**' +
+                        self._sub_inline(text) + '**')
+            return m.group('b_before') + self.make_bold(
+                self._sub_inline(text))
+        text = m.group('i_text')
+        if text is not None:
+            if m.group('i_esc'):
+                return (m.group('i_before') + '*' +
+                        self._sub_inline(text) + '*')
+            return m.group('i_before') + self.make_italics(
+                self._sub_inline(text))
+        text = m.group('u_text')
+        if text is not None:
+            if m.group('u_esc'):
+                return (m.group('u_before') + '_' +
+                        self._sub_inline(text) + '_')
+            return m.group('u_before') + self.make_underline(
+                self._sub_inline(text))
+        return self.make_note(self._sub_inline(m.group('n_text')))
+
+    def __getattr__(self, name):
+        # Subclasses must implement `make_italics`, `make_bold`,
+        # `make_underline` and `make_note`.
+        if name.startswith('make_'):
+            return _make_missing_stub(name)
+        raise AttributeError(name)
 
 
 class NullTextRenderer(BaseTextRenderer):
@@ -1,8 +1,15 @@
-import re
 import sys
 import logging
 import yaml
 import pytest
+
+try:
+    # libyaml parses the fixture files several times faster than the
+    # pure Python loader.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from jouvence.document import (
     JouvenceSceneElement, JouvenceSceneSection,
     TYPE_ACTION, TYPE_CENTEREDACTION, TYPE_CHARACTER, TYPE_DIALOG,
@@ -12,6 +19,11 @@ from jouvence.document import (
 from jouvence.parser import JouvenceParser, JouvenceParserError
 
 
+# The parser keeps no state between runs, so every script test can use
+# the same instance.
+_PARSER = JouvenceParser()
+
+
 def pytest_addoption(parser):
     parser.addoption(
             '--log-debug',
@@ -28,11 +40,32 @@ def pytest_configure(config):
 
 def pytest_collect_file(parent, path):
     if path.ext == '.yaml' and path.basename.startswith("test"):
-        return JouvenceScriptTestFile(path, parent)
+        return JouvenceScriptTestFile.from_parent(parent, fspath=path)
     return None
 
 
+def _flat_para(p):
+    if isinstance(p, str):
+        return (TYPE_ACTION, p)
+    if isinstance(p, JouvenceSceneElement):
+        return (p.type, p.text)
+    # Let the slow path report the unknown spec entry.
+    return object()
+
+
 def assert_scenes(actual, scenes):
+    # Fast path: flatten both sides and do one sequence compare. Only
+    # on a mismatch do we re-walk everything with per-element asserts
+    # to get a precise failure.
+    if len(actual) == len(scenes):
+        flat_a = [(a.header, [(p.type, p.text) for p in a.paragraphs])
+                  for a in actual]
+        flat_e = [(e[0] if e[0] is not None else a.header,
+                   [_flat_para(p) for p in e[1:]])
+                  for a, e in zip(actual, scenes)]
+        if flat_a == flat_e:
+            return
+
     assert len(actual) == len(scenes)
     for a, e in zip(actual, scenes):
         assert_scene(a, e[0], e[1:])
@@ -59,26 +92,6 @@ def assert_paragraph(actual, expected):
         raise NotImplementedError("Don't know what this is: %s" % expected)
 
 
-def _c(name):
-    return JouvenceSceneElement(TYPE_CHARACTER, name)
-
-
-def _p(text):
-    return JouvenceSceneElement(TYPE_PARENTHETICAL, text)
-
-
-def _d(text):
-    return JouvenceSceneElement(TYPE_DIALOG, text)
-
-
-def _t(text):
-    return JouvenceSceneElement(TYPE_TRANSITION, text)
-
-
-def _l(text):
-    return JouvenceSceneElement(TYPE_LYRICS, text)
-
-
 class UnexpectedScriptOutput(Exception):
     def __init__(self, actual, expected):
         self.actual = actual
@@ -87,13 +100,23 @@ class UnexpectedScriptOutput(Exception):
 
 class JouvenceScriptTestFile(pytest.File):
     def collect(self):
-        spec = yaml.load_all(self.fspath.open(encoding='utf8'),
-                             Loader=yaml.FullLoader)
+        # Hand libyaml the whole file as one bytes blob; it decodes
+        # UTF-8 itself, without going through a Python text stream.
+        spec = yaml.load_all(self.fspath.read_binary(),
+                             Loader=_YamlLoader)
+        # Return the full list instead of a generator, so the YAML
+        # decode runs in one tight loop without pytest bookkeeping
+        # interleaved between items.
+        items = []
+        base = self.fspath.basename
         for i, item in enumerate(spec):
-            name = '%s_%d' % (self.fspath.basename, i)
-            if 'test_name' in item:
-                name += '_%s' % item['test_name']
-            yield JouvenceScriptTestItem(name, self, item)
+            name = f'{base}_{i}'
+            tn = item.get('test_name')
+            if tn:
+                name = f'{name}_{tn}'
+            items.append(JouvenceScriptTestItem.from_parent(
+                self, name=name, spec=item))
+        return items
 
 
 class JouvenceScriptTestItem(pytest.Item):
@@ -111,8 +134,7 @@ class JouvenceScriptTestItem(pytest.Item):
         if intext is None or expected is None:
             raise Exception("No 'in' or 'out' specified.")
 
-        parser = JouvenceParser()
-        doc = parser.parseString(intext)
+        doc = _PARSER.parseString(intext)
         if title is not None:
             assert title == doc.title_values
 
@@ -155,7 +177,17 @@ def _repr_expected_scenes(scenes):
                                       p.text)
 
 
-RE_BLANK_LINE = re.compile(r"^\s+$")
+# Maps a spec item's leading token to the element type it stands for;
+# one dict lookup plus a direct constructor call replaces the former
+# if/elif ladder of one-liner factory helpers.
+_TYPE_BY_TOKEN = {
+    '@': TYPE_CHARACTER,
+    '=': TYPE_DIALOG,
+    '_': TYPE_PARENTHETICAL,
+    '>': TYPE_TRANSITION,
+    '~': TYPE_LYRICS,
+    '+': TYPE_SYNOPSIS,
+}
 
 
 def make_scenes(spec):
@@ -172,35 +204,25 @@ def make_scenes(spec):
             continue
 
         token = item[:1]
+        tail = item[1:]
         if token == '.':
             if cur_header or cur_paras:
-                out.append([cur_header] + cur_paras)
-            cur_header = item[1:]
+                out.append([cur_header, *cur_paras])
+            cur_header = tail
             cur_paras = []
         elif token == '!':
-            if item[1:3] == '><':
+            if tail[:2] == '><':
                 cur_paras.append(
-                    JouvenceSceneElement(TYPE_CENTEREDACTION, item[3:]))
+                    JouvenceSceneElement(TYPE_CENTEREDACTION, tail[2:]))
             else:
-                cur_paras.append(item[1:])
-        elif token == '@':
-            cur_paras.append(_c(item[1:]))
-        elif token == '=':
-            cur_paras.append(_d(item[1:]))
-        elif token == '_':
-            cur_paras.append(_p(item[1:]))
-        elif token == '>':
-            cur_paras.append(_t(item[1:]))
-        elif token == '~':
-            cur_paras.append(_l(item[1:]))
+                cur_paras.append(tail)
         elif token == '#':
-            cur_paras.append(
-                JouvenceSceneSection(1, item[1:]))
-        elif token == '+':
-            cur_paras.append(
-                JouvenceSceneElement(TYPE_SYNOPSIS, item[1:]))
+            cur_paras.append(JouvenceSceneSection(1, tail))
         else:
-            raise Exception("Unknown token: %s" % token)
+            el_type = _TYPE_BY_TOKEN.get(token)
+            if el_type is None:
+                raise Exception("Unknown token: %s" % token)
+            cur_paras.append(JouvenceSceneElement(el_type, tail))
     if cur_header or cur_paras:
-        out.append([cur_header] + cur_paras)
+        out.append([cur_header, *cur_paras])
     return out
@@ -16,7 +16,14 @@ class TestTextRenderer(BaseTextRenderer):
         return 'N:' + text + ':N'
 
 
-@pytest.mark.parametrize('intext, expected', [
+@pytest.fixture(scope='module')
+def renderer():
+    # The renderer is stateless, one instance serves all the tests.
+    return TestTextRenderer()
+
+
+EMPHASIS_CASES = [
+    # Underline.
     ("_Underline_", "U:Underline:U"),
     ("Here's an _underline_.", "Here's an U:underline:U."),
     ("Here's an _underline_ too", "Here's an U:underline:U too"),
@@ -25,15 +32,8 @@ class TestTextRenderer(BaseTextRenderer):
     ("This is _two underlined_ words.", "This is U:two underlined:U words."),
     ("This is _three underlined words_.",
      "This is U:three underlined words:U."),
-    ("This is an \\_escaped_ one.", "This is an _escaped_ one.")
-])
-def test_underline(intext, expected):
-    r = TestTextRenderer()
-    out = r.render_text(intext)
-    assert out == expected
-
-
-@pytest.mark.parametrize('intext, expected', [
+    ("This is an \\_escaped_ one.", "This is an _escaped_ one."),
+    # Italics.
     ("*Italics*", "I:Italics:I"),
     ("Here's some *italics*.", "Here's some I:italics:I."),
     ("Here's some *italics* too", "Here's some I:italics:I too"),
@@ -42,15 +42,8 @@ def test_underline(intext, expected):
     ("This is *two italics* words.", "This is I:two italics:I words."),
     ("This is *three italics words*.",
      "This is I:three italics words:I."),
-    ("This is some \\*escaped* one.", "This is some *escaped* one.")
-])
-def test_italics(intext, expected):
-    r = TestTextRenderer()
-    out = r.render_text(intext)
-    assert out == expected
-
-
-@pytest.mark.parametrize('intext, expected', [
+    ("This is some \\*escaped* one.", "This is some *escaped* one."),
+    # Bold.
     ("**Bold**", "B:Bold:B"),
     ("Here's some **bold**.", "Here's some B:bold:B."),
     ("Here's some **bold** too", "Here's some B:bold:B too"),
@@ -59,25 +52,34 @@ def test_italics(intext, expected):
     ("This is **two bold** words.", "This is B:two bold:B words."),
     ("This is **three bold words**.",
      "This is B:three bold words:B."),
-    ("This is some \\**escaped** one.", "This is some **escaped** one.")
-])
-def test_bold(intext, expected):
-    r = TestTextRenderer()
-    out = r.render_text(intext)
+    ("This is some \\**escaped** one.", "This is some **escaped** one."),
+    # Nested.
+    ("_Steel's face FILLS the *Leupold Mark 4* scope_.",
+     "U:Steel's face FILLS the I:Leupold Mark 4:I scope:U."),
+    ("*This has some _nested underline_ text*.",
+     "I:This has some U:nested underline:U text:I."),
+    ("Some [[notes have *italics* in them]] too.",
+     "Some N:notes have I:italics:I in them:N too.")
+]
+
+
+# Short precomputed ids, so collection doesn't repr every case string.
+@pytest.mark.parametrize('intext, expected', EMPHASIS_CASES,
+                         ids=['c%d' % i for i in range(len(EMPHASIS_CASES))])
+def test_emphasis(renderer, intext, expected):
+    out = renderer.render_text(intext)
     assert out == expected
 
 
-def test_note():
-    r = TestTextRenderer()
-    out = r.render_text(
+def test_note(renderer):
+    out = renderer.render_text(
         "This is JACK[[Do we have a better name?]]. He likes movies.")
     expected = "This is JACKN:Do we have a better name?:N. He likes movies."
     assert out == expected
 
 
-def test_note_with_line_break():
-    r = TestTextRenderer()
-    out = r.render_text(
+def test_note_with_line_break(renderer):
+    out = renderer.render_text(
         "This is JACK[[Do we have a better name?\n"
         "I think we did]]. He likes movies.")
     expected = ("This is JACKN:Do we have a better name?\n"
@@ -85,9 +87,8 @@ def test_note_with_line_break():
     assert out == expected
 
 
-def test_note_multiple():
-    r = TestTextRenderer()
-    out = r.render_text(
+def test_note_multiple(renderer):
+    out = renderer.render_text(
         "This is JACK[[Do we have a better name?]]. "
         "He likes movies[[or plays?]].")
     expected = ("This is JACKN:Do we have a better name?:N. "